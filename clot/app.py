@@ -1,13 +1,19 @@
 """A simple command-line interface to the clot.torrent package."""
 
 
-from argparse import ArgumentParser
-from os import path, walk
+from argparse import ArgumentParser, ArgumentTypeError
+from concurrent.futures import as_completed, ThreadPoolExecutor
+from os import cpu_count, path, scandir
 import shutil
+import threading
 
 from clot import __version__, torrent
 
 
+# Serializes console output and stashing when files are handled concurrently.
+_lock = threading.Lock()
+
+
 def main():
     """Execute actions according to the command-line arguments."""
     args = _parse_command_line()
@@ -70,6 +76,12 @@ def _add_traversal_arguments_to(parser):
                         action='store_true',
                         help='walk down into symbolic links that resolve to directories')
 
+    parser.add_argument('-j', '--jobs',
+                        type=_job_count,
+                        default=1,
+                        help='handle up to this number of files concurrently'
+                             ' (0 means the number of CPUs, default: %(default)s)')
+
     parser.add_argument('--ext',
                         default='.torrent',
                         help='filter the directories based on filename extension'
@@ -83,6 +95,16 @@ def _add_traversal_arguments_to(parser):
                              ' (default: current directory)')
 
 
+def _job_count(value):
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = -1
+    if jobs < 0:
+        raise ArgumentTypeError(f'expected a non-negative integer instead of {value!r}')
+    return jobs
+
+
 def _add_file_arguments_to(parser):
     parser.add_argument('-s', '--stash',
                         metavar='DIR',
@@ -124,32 +146,73 @@ def _add_dump_arguments_to(parser):
 def traverse_dir(dir_path, args):
     """Traverse the directory (flat or recursive) and handle files with the specified extension."""
     def onerror(ex):
-        print(ex)
-
-    for root, dirs, files in walk(dir_path, onerror=onerror, followlinks=args.follow_links):
-        if not args.recurse:
-            dirs.clear()
-
-        for name in files:
-            if name.endswith(args.ext):
-                file_path = path.join(root, name)
-                handle_file(file_path, args)
+        with _lock:
+            print(ex)
+
+    file_paths = _scan(dir_path, args.ext, args.recurse, args.follow_links, onerror)
+
+    if args.jobs == 1:
+        for file_path in file_paths:
+            handle_file(file_path, args)
+    else:
+        _handle_files_concurrently(file_paths, args)
+
+
+def _scan(dir_path, ext, recurse, follow_links, onerror):
+    # Directory entries cache their type from readdir, so unlike walk()
+    # this costs no extra stat() calls for names with other extensions.
+    pending_dirs = [dir_path]
+    while pending_dirs:
+        subdirs = []
+        try:
+            with scandir(pending_dirs.pop()) as entries:
+                for entry in entries:
+                    if entry.name.endswith(ext) and entry.is_file():
+                        yield entry.path
+                    elif recurse and entry.is_dir(follow_symlinks=follow_links):
+                        subdirs.append(entry.path)
+        except OSError as ex:
+            onerror(ex)
+
+        # Keep the top-down order of walk().
+        pending_dirs.extend(reversed(subdirs))
+
+
+def _handle_files_concurrently(file_paths, args):
+    with ThreadPoolExecutor(max_workers=args.jobs or cpu_count()) as executor:
+        futures = [executor.submit(handle_file, file_path, args) for file_path in file_paths]
+        try:
+            # Re-raise unexpected exceptions as soon as they occur.
+            for future in as_completed(futures):
+                future.result()
+        finally:
+            # Leave the files not started yet alone after an unexpected exception.
+            for future in futures:
+                future.cancel()
 
 
 def handle_file(file_path, args):
     """Handle the specified file based on args."""
-    if args.verbose:
+    # Concurrent jobs print the path once the file is handled, along with the error
+    # if any, so that the output for other files cannot come in between.
+    print_path_first = args.verbose and args.jobs == 1
+    if print_path_first:
         print(file_path)
 
     try:
         obj = torrent.load(file_path, fallback_encoding=args.fallback_encoding, lazy=args.lazy)
         args.func(file_path, obj, args)
     except (TypeError, ValueError) as ex:
-        if args.stash:
-            _stash_file(file_path, args.stash)
-        if not args.verbose:
-            print(file_path)
-        print('\t', repr(ex), sep='')
+        with _lock:
+            if args.stash:
+                _stash_file(file_path, args.stash)
+            if not print_path_first:
+                print(file_path)
+            print('\t', repr(ex), sep='')
+    else:
+        if args.verbose and not print_path_first:
+            with _lock:
+                print(file_path)
 
 
 def _stash_file(file_path, dir_path):
@@ -1,8 +1,28 @@
 """This module lets decode data according to the Bencoding specification."""
 
 
-def decode(value, *, keytostr=False):   # noqa: C901 pylint: disable=too-many-statements
+import sys
+
+
+# Type selectors, the end marker and the minus sign as they appear in the data.
+_DIGIT_0, _DIGIT_9, _MINUS = b'09-'
+_INT, _LIST, _DICT, _END = b'ilde'
+
+# Keys found in nearly every torrent are shared rather than created anew
+# for each dict, in either form (plain or decoded with keytostr).
+_KNOWN_KEYS = (
+    'announce', 'announce-list', 'codepage', 'comment', 'created by',
+    'creation date', 'encoding', 'files', 'info', 'length', 'md5sum',
+    'name', 'nodes', 'path', 'piece length', 'pieces', 'private',
+    'publisher', 'publisher-url', 'url-list',
+)
+_KNOWN_BYTES_KEYS = {key.encode(): key.encode() for key in _KNOWN_KEYS}
+_KNOWN_STR_KEYS = {key.encode(): sys.intern(key) for key in _KNOWN_KEYS}
+
+
+def decode(value, *, keytostr=False):   # noqa: C901
     """Return the decoded value."""
+    # pylint: disable=too-many-locals,too-many-branches,too-many-statements
     if not isinstance(value, bytes):
         raise TypeError(f'object of type {type(value)} cannot be decoded')
     if value == b'':
@@ -10,106 +30,96 @@ def decode(value, *, keytostr=False):   # noqa: C901 pylint: disable=too-many-st
 
     next_pos = 0
     last_pos = len(value)
+    find = value.find
+    known_keys = _KNOWN_STR_KEYS if keytostr else _KNOWN_BYTES_KEYS
 
-    def _unknown_type():
-        raise ValueError(f'unknown type selector 0x{value[next_pos]:02X}')
-
-    def _decode_bytes():
-        nonlocal next_pos
-
-        start = next_pos
-        end = value.find(b':', start + 1)
-        if end < 0:
-            raise ValueError('missing data size delimiter')
-        size = int(value[start:end])
-        if len(str(size)) != end - start:
-            # There were leading zeroes and/or trailing spaces there.
-            raise ValueError('malformed data size')
-
-        start = end + 1
-        end = start + size
-        if end > last_pos:
-            raise ValueError('wrong data size')
-        result = value[start:end]
-
-        next_pos = end
-        return result
-
-    def _decode_int():
-        nonlocal next_pos
-
-        start = next_pos + 1
-        end = value.find(b'e', start)
-        if end < 0:
-            raise ValueError('missing int value terminator')
-        result = int(value[start:end])
-        if len(str(result)) != end - start:
-            # There were spaces, leading zeroes, or a plus sign there.
-            raise ValueError('malformed int value')
+    # Nested containers are decoded in a loop rather than by recursion,
+    # so there is no limit on their depth.  The innermost container is
+    # kept in local variables along with its position and, for a dict,
+    # the key awaiting its value (None when awaiting the key itself);
+    # the outer ones are saved on the stack.
+    container = container_pos = key = None
+    stack = []
 
-        next_pos = end + 1
-        return result
-
-    def _decode_list():
-        nonlocal next_pos
-
-        result = []
-        list_pos = next_pos
-        next_pos += 1
-        while next_pos < last_pos:
-            if value[next_pos] == ord('e'):
+    try:
+        while True:
+            if next_pos == last_pos:
+                kind = 'list' if isinstance(container, list) else 'dict'
+                raise ValueError(f'missing {kind} value terminator', container_pos)
+
+            # Ordered by frequency: strings (including all keys) dominate.
+            result_pos = next_pos
+            selector = value[next_pos]
+            if _DIGIT_0 <= selector <= _DIGIT_9:
+                end = find(b':', next_pos + 1)
+                if end < 0:
+                    raise ValueError('missing data size delimiter')
+                digits = value[next_pos:end]
+                size = int(digits)
+                # The first byte is known to be a digit, so only a leading zero
+                # or whatever int() tolerates after it (spaces, underscores) is left.
+                if not digits.isdigit() or (digits[0] == _DIGIT_0 and end - next_pos > 1):
+                    raise ValueError('malformed data size')
+                start = end + 1
+                end = start + size
+                if end > last_pos:
+                    raise ValueError('wrong data size')
+                result = value[start:end]
+                next_pos = end
+            elif selector == _INT:
+                start = next_pos + 1
+                end = find(b'e', start)
+                if end < 0:
+                    raise ValueError('missing int value terminator')
+                digits = value[start:end]
+                result = int(digits)
+                # Rule out whatever int() tolerates (spaces, underscores,
+                # a plus sign) as well as leading zeroes and negative zero.
+                if digits.isdigit():
+                    malformed = digits[0] == _DIGIT_0 and end - start > 1
+                elif digits[0] == _MINUS:
+                    malformed = not digits[1:].isdigit() or digits[1] == _DIGIT_0
+                else:
+                    malformed = True
+                if malformed:
+                    raise ValueError('malformed int value')
+                next_pos = end + 1
+            elif selector == _END and container is not None and key is None:
+                result, result_pos = container, container_pos
+                container, container_pos, key = stack.pop()
                 next_pos += 1
-                return result
-            result.append(_decode_item())
-
-        raise ValueError('missing list value terminator', list_pos)
-
-    def _decode_dict():
-        nonlocal next_pos
-
-        result = {}
-        dict_pos = next_pos
-        next_pos += 1
-        while next_pos < last_pos:
-            if value[next_pos] == ord('e'):
+            elif selector == _DICT or selector == _LIST:  # pylint: disable=consider-using-in
+                stack.append((container, container_pos, key))
+                container = {} if selector == _DICT else []
+                container_pos = next_pos
+                key = None
                 next_pos += 1
-                return result
-            key_pos = next_pos
-            key = _decode_item()
-            if not isinstance(key, bytes):
-                raise ValueError(f'unsupported key type {type(key)}', key_pos)
-            if keytostr:
-                try:
-                    key = key.decode()
-                except UnicodeDecodeError as ex:
-                    raise ValueError(f'not a UTF-8 key {key}', key_pos) from ex
-            if key in result:
-                raise ValueError(f'duplicate key {key}', key_pos)
-            result[key] = _decode_item()
-
-        raise ValueError('missing dict value terminator', dict_pos)
-
-    selector = {
-        ord('0'): _decode_bytes,
-        ord('1'): _decode_bytes,
-        ord('2'): _decode_bytes,
-        ord('3'): _decode_bytes,
-        ord('4'): _decode_bytes,
-        ord('5'): _decode_bytes,
-        ord('6'): _decode_bytes,
-        ord('7'): _decode_bytes,
-        ord('8'): _decode_bytes,
-        ord('9'): _decode_bytes,
-        ord('i'): _decode_int,
-        ord('l'): _decode_list,
-        ord('d'): _decode_dict,
-    }
+                continue
+            else:
+                raise ValueError(f'unknown type selector 0x{selector:02X}')
+
+            # Put the decoded item into the innermost container, if any.
+            if container is None:
+                break
+            if key is not None:
+                container[key] = result
+                key = None
+            elif isinstance(container, list):
+                container.append(result)
+            elif not isinstance(result, bytes):
+                raise ValueError(f'unsupported key type {type(result)}', result_pos)
+            else:
+                key = known_keys.get(result)
+                if key is None and keytostr:
+                    try:
+                        key = result.decode()
+                    except UnicodeDecodeError as ex:
+                        raise ValueError(f'not a UTF-8 key {result}', result_pos) from ex
+                elif key is None:
+                    key = result
+                if key in container:
+                    raise ValueError(f'duplicate key {key}', result_pos)
 
-    def _decode_item():
-        return selector.get(value[next_pos], _unknown_type)()
-
-    try:
-        result = _decode_item()
         if next_pos != last_pos:
             raise ValueError('extra bytes at the end')
     except ValueError as ex:
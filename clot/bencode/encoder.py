@@ -2,81 +2,157 @@
 
 
 from datetime import datetime
-import functools
+from operator import itemgetter
+
+
+# Integers in torrents are mostly small (flags, counters, exponents),
+# so their encodings are prepared beforehand.
+_SMALL_INTS = tuple(b'i%de' % value for value in range(1024))
+
+# The same goes for length prefixes of strings (keys, names, hashes).
+_LENGTH_PREFIXES = tuple(b'%d:' % length for length in range(256))
+
+# Strings are output along with their length prefix as a single part,
+# except for the large ones (like piece hashes) not worth copying.
+_FUSED_SIZE_LIMIT = 64 * 1024
 
 
 def encode(value, *, strict=False):
     """Return the encoded value or raise an error on unsupported types."""
-    return b''.join(iterencode(value, strict=strict))
+    return b''.join(_encode_parts(value, strict))
+
+
+def iterencode(value, *, strict=False):
+    """Yield bencoding parts for the value or raise an error on unsupported types.
 
+    The value is encoded in full before the first part is yielded, so the parts
+    take as much memory as the whole output and errors come before any part.
+    """
+    yield from _encode_parts(value, strict)
 
-def iterencode(value, *, strict=False):     # noqa: C901
-    """Yield bencoding parts for the value or raise an error on unsupported types."""
-    location = []
 
-    @functools.singledispatch
-    def func(value):
+def _encode_parts(value, strict):
+    # Appending to a list and joining once beats growing a bytearray.
+    parts = []
+    _encode_value(value, parts.append, strict, [])
+    return parts
+
+
+def _encode_value(value, write, strict, location):
+    # Exact type checks cover nearly all values; bool, subclasses
+    # and the types allowed in non-strict mode take the slow path.
+    value_type = type(value)
+    if value_type is bytes:
+        _encode_bytes(value, write)
+    elif value_type is int:
+        _encode_int(value, write)
+    elif value_type is dict:
+        _encode_dict(value, write, strict, location)
+    elif value_type is list:
+        _encode_list(value, write, strict, location)
+    else:
+        _encode_other(value, write, strict, location)
+
+
+def _encode_other(value, write, strict, location):
+    if isinstance(value, bytes):
+        _encode_bytes(value, write)
+    elif isinstance(value, int):
+        _encode_int(value, write)
+    elif isinstance(value, dict):
+        _encode_dict(value, write, strict, location)
+    elif isinstance(value, list):
+        _encode_list(value, write, strict, location)
+    elif strict:
+        raise TypeError(f'object of type {type(value)} cannot be encoded', location)
+    elif isinstance(value, str):
+        _encode_bytes(value.encode(), write)
+    elif isinstance(value, tuple):
+        _encode_list(value, write, strict, location)
+    elif isinstance(value, datetime):
+        _encode_int(int(value.timestamp()), write)
+    else:
         raise TypeError(f'object of type {type(value)} cannot be encoded', location)
 
-    @func.register(bytes)
-    def _encode_bytes(value):
-        value_length = len(value)
-        yield b'%d' % value_length
-        yield b':'
-        if value_length > 0:
-            yield value
-
-    @func.register(int)
-    def _encode_int(value):
-        yield b'i'
-        yield b'%d' % value
-        yield b'e'
-
-    @func.register(bool)
-    def _encode_bool(value):
-        yield b'i'
-        yield b'1' if value else b'0'
-        yield b'e'
-
-    @func.register(list)
-    def _encode_list(values):
-        yield b'l'
-        for index, value in enumerate(values):
+
+def _encode_bytes(value, write):
+    value_length = len(value)
+    if value_length < len(_LENGTH_PREFIXES):
+        write(_LENGTH_PREFIXES[value_length] + value)
+    elif value_length < _FUSED_SIZE_LIMIT:
+        write(b'%d:%b' % (value_length, value))
+    else:
+        write(b'%d:' % value_length)
+        write(value)
+
+
+def _encode_int(value, write):
+    if 0 <= value < len(_SMALL_INTS):
+        write(_SMALL_INTS[value])
+    else:
+        write(b'i%de' % value)
+
+
+def _encode_list(values, write, strict, location):
+    write(b'l')
+    for index, value in enumerate(values):
+        # Strings and integers (like file paths or node ports) cannot fail,
+        # so they skip both the location tracking and the type dispatch.
+        value_type = type(value)
+        if value_type is bytes:
+            _encode_bytes(value, write)
+        elif value_type is int:
+            _encode_int(value, write)
+        else:
             location.append(index)
-            yield from func(value)
-            location.pop()
-        yield b'e'
-
-    @func.register(dict)
-    def _encode_dict(values):
-        yield b'd'
-        last_encoded_key = None
-        for encoded_key, _, value, key in sorted(_iter_dict_check_keys(values)):
-            if encoded_key == last_encoded_key:
-                raise ValueError(f'duplicate key {key}', location)
-            last_encoded_key = encoded_key
-            location.append(key)
-            yield from _encode_bytes(encoded_key)
-            yield from func(value)
+            _encode_value(value, write, strict, location)
             location.pop()
-        yield b'e'
-
-    def _iter_dict_check_keys(values):
-        """Yield 4-tuples of (encoded key, ordinal, value, original key) from a dict."""
-        for key, value in values.items():
-            # For consistency in error reporting, let bytes go before str
-            # in case of duplicate keys.  The error message will refer to
-            # the str key then.
-            if isinstance(key, bytes):
-                yield key, 0, value, key
-            elif not strict and isinstance(key, str):
-                yield key.encode(), 1, value, key
-            else:
-                raise TypeError(f'invalid key type {type(key)}', location)
-
-    if not strict:
-        func.register(str, lambda x: _encode_bytes(x.encode()))
-        func.register(tuple, _encode_list)
-        func.register(datetime, lambda x: _encode_int(int(x.timestamp())))
-
-    yield from func(value)
+    write(b'e')
+
+
+def _encode_dict(values, write, strict, location):
+    write(b'd')
+    last_encoded_key = None
+    for encoded_key, value, key in _sorted_dict_items(values, strict, location):
+        if encoded_key == last_encoded_key:
+            raise ValueError(f'duplicate key {key}', location)
+        last_encoded_key = encoded_key
+        location.append(key)
+        _encode_bytes(encoded_key, write)
+        _encode_value(value, write, strict, location)
+        location.pop()
+    write(b'e')
+
+
+def _sorted_dict_items(values, strict, location):
+    """Return a list of (encoded key, value, original key) sorted by the encoded key."""
+    items = []
+    str_items = []
+    for key, value in values.items():
+        # Exact type checks go first: str keys are the most common ones
+        # (dicts of a torrent are decoded with keytostr), then bytes.
+        key_type = type(key)
+        if key_type is str and not strict:
+            str_items.append((key.encode(), value, key))
+        elif key_type is bytes or isinstance(key, bytes):
+            items.append((key, value, key))
+        elif not strict and isinstance(key, str):
+            str_items.append((key.encode(), value, key))
+        else:
+            raise TypeError(f'invalid key type {type(key)}', location)
+
+    # For consistency in error reporting, let bytes go before str
+    # in case of duplicate keys (the sort is stable).  The error
+    # message will refer to the str key then.
+    items += str_items
+
+    # Dictionaries of decoded torrents are in order already, and checking
+    # that in a loop is cheaper than a no-op sort for the small ones.
+    if len(items) > 1:
+        previous_key = items[0][0]
+        for item in items:
+            if item[0] < previous_key:
+                items.sort(key=itemgetter(0))
+                break
+            previous_key = item[0]
+    return items
@@ -23,6 +23,8 @@ class _JsonEncoder(json.JSONEncoder):
 class Backbone(metaclass=Layout):
     """Torrent file low-level contents."""
 
+    __slots__ = ('data', 'file_path', 'fallback_encoding', '__weakref__')
+
     def __init__(self, raw_bytes, *, file_path=None, fallback_encoding=None, lazy=None):
         """Initialize self."""
         self.data = bencode.decode(raw_bytes, keytostr=True)
@@ -34,12 +36,42 @@ class Backbone(metaclass=Layout):
         if not lazy:
             self.load_fields()  # pylint: disable=no-member
 
+    def __reduce__(self):
+        """Return state information for pickling and copying."""
+        # The raw data is passed as is rather than decoded again, and the rest of the
+        # state comes along: the fields loaded so far (so that they need not be validated
+        # again either) and the attributes which subclasses may add.
+        state = self.__getstate__()
+        args = (state.pop('data'), state.pop('file_path'), state.pop('fallback_encoding'))
+        return self._from_state, args, state
+
+    @classmethod
+    def _from_state(cls, data, file_path, fallback_encoding):
+        instance = cls.__new__(cls)
+        instance.data = data
+        instance.file_path = file_path
+        instance.fallback_encoding = fallback_encoding
+        return instance
+
+    def __getstate__(self):
+        """Return the state of self for pickling and copying."""
+        # Unlike the default state of slotted objects, this one is a plain dictionary,
+        # which can be pickled with the protocols 0 and 1 as well.
+        state = {name: getattr(self, name)
+                 for name in _slot_names(type(self)) if hasattr(self, name)}
+        # Subclasses without slots keep their own attributes in a dictionary.
+        state.update(getattr(self, '__dict__', ()))
+        return state
+
+    def __setstate__(self, state):
+        """Restore the state of self when unpickling and copying."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def save_as(self, file_path, *, overwrite=False):
         """Write the torrent to a file and remember the new path and contents on success."""
         self.save_fields()  # pylint: disable=no-member
-        raw_bytes = bencode.encode(self.data)
-        with open(file_path, 'wb' if overwrite else 'xb') as file:
-            file.write(raw_bytes)
+        self._write_to(file_path, 'wb' if overwrite else 'xb')
         self.file_path = file_path
 
     def save(self):
@@ -48,13 +80,35 @@ class Backbone(metaclass=Layout):
             raise ValueError('expected a torrent loaded from file')
 
         self.save_fields()  # pylint: disable=no-member
-        raw_bytes = bencode.encode(self.data)
-        with open(self.file_path, 'wb') as file:
-            file.write(raw_bytes)
+        self._write_to(self.file_path, 'wb')
+
+    def _write_to(self, file_path, mode):
+        # The parts are written as they are rather than joined into a copy
+        # of the whole contents, but only once all of them are encoded
+        # so that encoding errors do not leave a file behind.
+        parts = list(bencode.iterencode(self.data))
+        with open(file_path, mode) as file:
+            file.writelines(parts)
 
     def dump(self, file_path, *, indent=None, sort_keys=False, overwrite=False):
         """Write the torrent to a file in JSON format."""
         self.save_fields()  # pylint: disable=no-member
+        # Unlike json.dump(), json.dumps() can use the C accelerator
+        # and leaves nothing behind if the data cannot be serialized.
+        contents = json.dumps(self.data, cls=_JsonEncoder, ensure_ascii=False,
+                              indent=indent, sort_keys=sort_keys)
         with open(file_path, 'w' if overwrite else 'x', encoding='utf-8') as file:
-            json.dump(self.data, file, cls=_JsonEncoder, ensure_ascii=False,
-                      indent=indent, sort_keys=sort_keys)
+            file.write(contents)
+
+
+def _slot_names(cls):
+    """Yield the names of the slots which can hold values in instances of the class."""
+    for klass in cls.__mro__:
+        slots = vars(klass).get('__slots__', ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name in ('__dict__', '__weakref__'):
+                continue
+            if name.startswith('__') and not name.endswith('__'):
+                # Private names are mangled with the name of the class defining them.
+                name = f"_{klass.__name__.lstrip('_')}{name}"
+            yield name
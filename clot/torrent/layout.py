@@ -2,14 +2,22 @@
 
 
 from abc import ABC, abstractmethod
+import sys
 
 
 # pylint: disable=no-member
 
 
+# Tells a field value not loaded yet from None (i.e. a missing field).
+_NOT_LOADED = object()
+
+
 class Validator(ABC):
     """Base class to validate field types and values."""
 
+    # Names of other fields consulted when loading the value.
+    dependencies = ()
+
     def __init__(self, **kwargs):
         """Initialize self."""
         # Report unexpected arguments.
@@ -39,8 +47,9 @@ class Attr(Validator):
 
     def __init__(self, key, **kwargs):
         """Initialize self."""
-        self.key = key
-        self.loaded = None
+        # Keys of decoded dictionaries are interned as well, so that
+        # looking them up mostly takes an identity check.
+        self.key = sys.intern(key)
         super().__init__(**kwargs)
 
     def __set_name__(self, owner, name):
@@ -54,12 +63,10 @@ class Attr(Validator):
         if instance is None:
             return self
 
-        try:
-            return getattr(instance, self.private_name)
-        except AttributeError:
-            pass
-
-        return self.load_from(instance)
+        value = getattr(instance, self.private_name, _NOT_LOADED)
+        if value is _NOT_LOADED:
+            value = self.load_from(instance)
+        return value
 
     def __set__(self, instance, value):
         """Set the field value in the specified instance."""
@@ -75,23 +82,18 @@ class Attr(Validator):
             value = None
         else:
             value = self.validate(value)
+            self.delete_value(instance)
 
-        self.delete_value(instance)
-        self.loaded = True
         setattr(instance, self.private_name, value)
         return value
 
     def save_to(self, instance):
         """Update the instance data dictionary with the field value."""
-        try:
-            value = getattr(instance, self.private_name)
-        except AttributeError:
-            pass
-        else:
-            if value is None:
-                self.delete_value(instance)
-            else:
-                self.save_value(instance, value)
+        value = getattr(instance, self.private_name, _NOT_LOADED)
+        if value is None:
+            self.delete_value(instance)
+        elif value is not _NOT_LOADED:
+            self.save_value(instance, value)
 
 
 class Layout(type):
@@ -99,23 +101,29 @@ class Layout(type):
 
     def __new__(mcs, name, bases, mapping):     # noqa: N804
         """Create the class after expanding the original mapping."""
-        fields = [value for value in mapping.values() if isinstance(value, Attr)]
+        fields = {attr_name: value for attr_name, value in mapping.items()
+                  if isinstance(value, Attr)}
+
+        # Fields consulted by others while loading (like "encoding" and "codepage"
+        # for the encoded fields) go first, so that they are never loaded twice;
+        # otherwise the instance data dictionary would already have the associated
+        # key popped and field values would become None.  The sort is stable.
+        dependencies = {attr_name for field in fields.values() for attr_name in field.dependencies}
+        load_order = sorted(fields, key=lambda attr_name: attr_name not in dependencies)
+
+        # Bind the methods once rather than looking them up on every call.
+        loaders = tuple(fields[attr_name].load_from for attr_name in load_order)
+        private_names = tuple('_' + attr_name for attr_name in fields)
+        fields = tuple(fields.values())
+        savers = tuple(field.save_to for field in fields)
 
         def load_fields(self):
-            for field in self._fields:
-                field.loaded = False
-
-            for field in self._fields:
-                # The "encoding" and "codepage" fields are indirectly loaded right
-                # before loading the first encoded field.  Prevent them from being
-                # loaded again; otherwise the instance data dictionary will already
-                # have the associated key popped and field values become None.
-                if not field.loaded:
-                    field.load_from(self)
+            for load_from in loaders:
+                load_from(self)
 
         def save_fields(self):
-            for field in self._fields:
-                field.save_to(self)
+            for save_to in savers:
+                save_to(self)
 
         new_stuff = {
             '_fields': fields,
@@ -129,4 +137,12 @@ class Layout(type):
 
         mapping.update(new_stuff)
 
+        if fields:
+            # Keep the field values (named as in Attr.__set_name__) in slots, which
+            # spares instances a dictionary as long as the base classes have slots.
+            slots = mapping.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            mapping['__slots__'] = tuple(slots) + private_names
+
         return super().__new__(mcs, name, bases, mapping)
@@ -1,8 +1,11 @@
 """This module implements field type and value validators."""
 
 
+import codecs
 from collections.abc import Iterable
 from datetime import datetime, timezone
+from functools import lru_cache
+from importlib import import_module
 from urllib.parse import urlparse
 
 from .layout import Validator
@@ -12,6 +15,10 @@ from .values import List
 # pylint: disable=no-member
 
 
+# Concrete types go first, as checking against an ABC is slow.
+_ITERABLE = (list, tuple, Iterable)
+
+
 class Typed(Validator):
     """Validates the value being of specific type."""
 
@@ -50,7 +57,7 @@ class NonEmpty(Validator):
 
     def validate(self, value):
         """Raise an exception if the value consists of whitespace only."""
-        if not value.strip():
+        if not value or value.isspace():
             raise ValueError(f'{self.name}: empty value is not allowed')
         return super().validate(value)
 
@@ -58,6 +65,8 @@ class NonEmpty(Validator):
 class Encoded(Validator):
     """Decodes bytes to a string value using the UTF-8 encoding."""
 
+    dependencies = ('codepage', 'encoding')
+
     def __init__(self, encoding=None, **kwargs):
         """Initialize self."""
         self.encoding = encoding
@@ -69,22 +78,17 @@ class Encoded(Validator):
         if not isinstance(value, bytes):
             raise TypeError(f'{self.name}: expected {value!r} to be of type {bytes}')
 
-        encodings = []
         if self.encoding:
-            encodings.append(self.encoding)
+            encodings = (self.encoding,)
         else:
-            codepage = getattr(instance, 'codepage', None)
-            if codepage:
-                codepage = f'cp{codepage}'
+            encodings = _encodings(getattr(instance, 'encoding', None),
+                                   getattr(instance, 'codepage', None),
+                                   getattr(instance, 'fallback_encoding', None))
 
-            encoding = getattr(instance, 'encoding', None) or codepage
-            if encoding and encoding.replace('_', '-').upper() not in ('UTF-8', 'UTF8'):
-                encodings.append(encoding)
-            encodings.append('UTF-8')
-
-            fallback_encoding = getattr(instance, 'fallback_encoding', None)
-            if fallback_encoding:
-                encodings.append(fallback_encoding)
+        # Most values are plain ASCII, for which the ASCII codec is much faster
+        # than the charmap ones (like cp1251) and gives the same result.
+        if value.isascii() and _reads_ascii_as_is(encodings[0]):
+            return value.decode('ascii')
 
         for encoding in encodings:
             try:
@@ -96,6 +100,51 @@ class Encoded(Validator):
         raise ValueError(f'{self.name}: cannot decode {value!r} as {encodings}')
 
 
+# Torrents mostly share a few combinations of these settings.
+@lru_cache(maxsize=256)
+def _encodings(encoding, codepage, fallback_encoding):
+    """Return the encodings to try in order according to the torrent settings."""
+    encodings = []
+
+    if codepage:
+        codepage = f'cp{codepage}'
+
+    encoding = encoding or codepage
+    if encoding and encoding.replace('_', '-').upper() not in ('UTF-8', 'UTF8'):
+        encodings.append(encoding)
+    encodings.append('UTF-8')
+
+    if fallback_encoding:
+        encodings.append(fallback_encoding)
+
+    return tuple(encodings)
+
+
+_ASCII_STR = bytes(range(128)).decode('ascii')
+
+# Codecs decoding ASCII bytes the same way the ASCII codec does, apart from the
+# single-byte ones checked by their tables.  Others (like the stateful, escape or
+# IDNA codecs) may turn ASCII bytes into other text, so they are not trusted.
+_ASCII_SUPERSETS = frozenset(('ascii', 'utf-8'))
+
+
+# The encoding names come from the torrents, hence the bound.
+@lru_cache(maxsize=64)
+def _reads_ascii_as_is(encoding):
+    """Return True if the encoding decodes ASCII bytes the same way the ASCII codec does."""
+    name = codecs.lookup(encoding).name
+    if name in _ASCII_SUPERSETS:
+        return True
+
+    # Charmap codecs (like cp1251 or iso8859-5) decode each byte through a table,
+    # which need not start with ASCII (compare cp037).
+    try:
+        decoding_table = import_module('encodings.' + name.replace('-', '_')).decoding_table
+    except (ImportError, AttributeError):
+        return False
+    return decoding_table[:128] == _ASCII_STR
+
+
 class UnixEpoch(Validator):
     """Interprets int as a timestamp in the standard Unix epoch format."""
 
@@ -105,10 +154,8 @@ class UnixEpoch(Validator):
         if not isinstance(value, int):
             raise TypeError(f'{self.name}: expected {value!r} to be of type {int}')
 
-        # Interpret the value according to the standard Unix epoch format, which represents
-        # the number of seconds elapsed since 1970-01-01 00:00:00 +0000 (UTC).
         try:
-            return datetime.fromtimestamp(value, timezone.utc)
+            return _utc_from_epoch(value)
         except (OverflowError, OSError, ValueError) as ex:
             raise ValueError(f'{self.name}: cannot convert {value!r} to a timestamp') from ex
 
@@ -119,6 +166,14 @@ class UnixEpoch(Validator):
         return super().validate(value)
 
 
+# Torrents made by the same tool in one go tend to share their creation date.
+@lru_cache(maxsize=1024)
+def _utc_from_epoch(value):
+    """Return the UTC datetime for the timestamp in the standard Unix epoch format."""
+    # The format represents the number of seconds elapsed since 1970-01-01 00:00:00 +0000 (UTC).
+    return datetime.fromtimestamp(value, timezone.utc)
+
+
 class _UrlAware:    # pylint: disable=too-few-public-methods
     """Mixin class to decode and validate URL strings."""
 
@@ -130,7 +185,9 @@ class _UrlAware:    # pylint: disable=too-few-public-methods
 
     def __init__(self, schemes=None, require_scheme=True, **kwargs):
         """Initialize self."""
-        self.schemes = list(filter(None, schemes or self.default_schemes))
+        # Parsed schemes come in lower case.
+        self.schemes = frozenset(scheme.lower() for scheme in schemes or self.default_schemes
+                                 if scheme)
         self.require_scheme = require_scheme
         super().__init__(**kwargs)
 
@@ -148,22 +205,30 @@ class _UrlAware:    # pylint: disable=too-few-public-methods
         if not value:
             return None
 
-        parsed = urlparse(value)
-        if not parsed.scheme.strip():
-            hostname = parsed.path
+        scheme, hostname = _split_url(value)
+        if not scheme:
             if self.require_scheme:
                 raise ValueError(f'{self.name}: the value {value!r} is ill-formed (missing scheme)')
-        else:
-            hostname = parsed.hostname
-            if parsed.scheme not in self.schemes:
-                raise ValueError(f'{self.name}: the value {value!r} is ill-formed'
-                                 ' (unexpected scheme)')
-        if hostname is None or not hostname.strip():
+        elif scheme not in self.schemes:
+            raise ValueError(f'{self.name}: the value {value!r} is ill-formed'
+                             ' (unexpected scheme)')
+        if not hostname:
             raise ValueError(f'{self.name}: the value {value!r} is ill-formed (missing hostname)')
 
         return value
 
 
+# The same trackers and mirrors recur across tiers and torrents.
+@lru_cache(maxsize=4096)
+def _split_url(value):
+    """Return the scheme and stripped hostname (or path when there is no scheme) of the URL."""
+    # Parsed schemes never contain whitespace, unlike hostnames.
+    parsed = urlparse(value)
+    if not parsed.scheme:
+        return parsed.scheme, parsed.path.strip()
+    return parsed.scheme, (parsed.hostname or '').strip()
+
+
 class ValidUrl(_UrlAware, Validator):
     """Ensures the value is an URL with non-empty scheme and hostname."""
 
@@ -193,7 +258,7 @@ class ValidUrlList(_UrlAware, Validator):
             pass
         elif isinstance(value, (bytes, str)):
             value = List(self.valid_url, value)
-        elif isinstance(value, Iterable):
+        elif isinstance(value, _ITERABLE):
             value = List(self.valid_url, *value)
         else:
             raise TypeError(f'{self.name}: expected {value!r} to be of type'
@@ -223,7 +288,7 @@ class ValidNodeList(Validator):
         """Raise an exception on nonconforming values."""
         if self.__assign_as_is(value):
             pass
-        elif isinstance(value, Iterable):
+        elif isinstance(value, _ITERABLE):
             value = List(self.valid_node, *value)
         else:
             raise TypeError(f'{self.name}: expected {value!r} to be of type {List}, or an iterable')
@@ -275,7 +340,7 @@ class ValidAnnounceList(_UrlAware, Validator):
         """Raise an exception on nonconforming values."""
         if self.__assign_as_is(value):
             pass
-        elif isinstance(value, Iterable):
+        elif isinstance(value, _ITERABLE):
             value = List(self.valid_tier, *value)
         else:
             raise TypeError(f'{self.name}: expected {value!r} to be of type {List}, or an iterable')
@@ -287,7 +352,7 @@ class ValidAnnounceList(_UrlAware, Validator):
 
     def valid_tier(self, value):
         """Raise an exception on nonconforming values."""
-        if isinstance(value, Iterable):
+        if isinstance(value, _ITERABLE):
             value = List(self.valid_url, *value)
         else:
             raise TypeError(f'{self.name}: expected {value!r} to be an iterable')
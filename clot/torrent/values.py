@@ -1,42 +1,56 @@
 """This module implements custom value types."""
 
 
-from collections.abc import MutableSequence
-
-
-class List(MutableSequence):    # pylint: disable=too-many-ancestors
+class List(list):
     """A list of items satisfiying the constraint passed in."""
 
+    # Only the methods adding items are overridden, the rest are inherited as is.
+
     def __init__(self, valid_item, *values):
         """Initialize self."""
         self.valid_item = valid_item
-        filtered_values = (value for value in values if value is not None)
-        valid_values = (self.valid_item(value) for value in filtered_values)
-        self.data = list(value for value in valid_values if value is not None)
+        super().__init__([valid_value for value in values
+                          if value is not None and (valid_value := valid_item(value)) is not None])
+
+    def __reduce__(self):
+        """Return state information for pickling and copying."""
+        # The items are valid already, so they are restored as is rather than passed
+        # through the methods above (validators which convert need not be idempotent).
+        return _rebuild_list, (type(self), list(self)), vars(self)
 
     def __repr__(self):
         """Return repr(self)."""
-        return f'{type(self).__name__}({self.data})'
-
-    def __len__(self):
-        """Return len(self)."""
-        return len(self.data)
-
-    def __getitem__(self, index):
-        """Return self[index]."""
-        return self.data[index]
+        return f'{type(self).__name__}({super().__repr__()})'
 
     def __setitem__(self, index, value):
         """Set self[index] to value."""
         if isinstance(index, slice):
-            self.data[index] = list(self.valid_item(item) for item in value)
+            valid_item = self.valid_item
+            super().__setitem__(index, [valid_item(item) for item in value])
         else:
-            self.data[index] = self.valid_item(value)
+            super().__setitem__(index, self.valid_item(value))
+
+    def __iadd__(self, values):
+        """Implement self += values."""
+        self.extend(values)
+        return self
+
+    def append(self, value):
+        """Append value to the end of the list."""
+        super().append(self.valid_item(value))
 
-    def __delitem__(self, index):
-        """Delete self[index]."""
-        del self.data[index]
+    def extend(self, values):
+        """Extend the list by appending values from the iterable."""
+        valid_item = self.valid_item
+        super().extend([valid_item(value) for value in values])
 
     def insert(self, index, value):
         """Insert value before index."""
-        self.data.insert(index, self.valid_item(value))
+        super().insert(index, self.valid_item(value))
+
+
+def _rebuild_list(cls, items):
+    """Return a list of the class given holding the items without validating them."""
+    instance = cls.__new__(cls)
+    list.extend(instance, items)
+    return instance
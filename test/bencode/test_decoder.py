@@ -1,3 +1,5 @@
+import sys
+
 import tcm
 
 from clot import bencode
@@ -42,6 +44,18 @@ class DecodeTestCase(tcm.TestCase):
         result = bencode.decode(value)
         self.assertEqual(result, expected_result)
 
+    def test_known_keys_are_shared(self):
+        [first_key] = bencode.decode(b'd4:infodee')
+        [second_key] = bencode.decode(b'd4:infodee')
+        self.assertIs(first_key, second_key)
+
+    def test_nesting_depth_is_not_limited_by_recursion(self):
+        depth = 10 * sys.getrecursionlimit()
+        result = bencode.decode(b'l' * depth + b'e' * depth)
+        for _ in range(depth - 1):
+            result, = result
+        self.assertListEqual(result, [])
+
     @tcm.values(
         (None,          TypeError, 'cannot be decoded'),
         (bytearray(),   TypeError, 'cannot be decoded'),
@@ -63,6 +77,7 @@ class DecodeTestCase(tcm.TestCase):
         (b'0',          0, ValueError, 'missing data size delimiter'),
         (b'00:',        0, ValueError, 'malformed data size'),
         (b'0 :',        0, ValueError, 'malformed data size'),
+        (b'1_0:',       0, ValueError, 'malformed data size'),
         (b'0:x',        2, ValueError, 'extra bytes at the end'),
         (b'2:x',        0, ValueError, 'wrong data size'),
         (b'2.:x',       0, ValueError, 'invalid literal for int'),
@@ -74,6 +89,10 @@ class DecodeTestCase(tcm.TestCase):
         (b'i03e',       0, ValueError, 'malformed int value'),
         (b'i-0e',       0, ValueError, 'malformed int value'),
         (b'i 1 e',      0, ValueError, 'malformed int value'),
+        (b'i+1e',       0, ValueError, 'malformed int value'),
+        (b'i1_0e',      0, ValueError, 'malformed int value'),
+        (b'i-01e',      0, ValueError, 'malformed int value'),
+        (b'i-1 e',      0, ValueError, 'malformed int value'),
         (b'i0e-',       3, ValueError, 'extra bytes at the end'),
 
         # Lists
@@ -85,6 +104,7 @@ class DecodeTestCase(tcm.TestCase):
         (b'd e',        1, ValueError, 'unknown type selector 0x20'),
         (b'de-',        2, ValueError, 'extra bytes at the end'),
         (b'd',          0, ValueError, 'missing dict value terminator'),
+        (b'd3:cow',     0, ValueError, 'missing dict value terminator'),
         (b'd3:cowe',    6, ValueError, 'unknown type selector 0x65'),
         (b'd3:cowi0e3:cowi0ee', 9, ValueError, 'duplicate key'),
         (b'di0e3:cowe', 1, ValueError, 'unsupported key type'),
@@ -106,6 +126,11 @@ class DecodeKeyToStrTestCase(tcm.TestCase):
         result = bencode.decode(value, keytostr=True)
         self.assertEqual(result, expected_result)
 
+    def test_known_keys_are_shared(self):
+        [first_key] = bencode.decode(b'd4:infodee', keytostr=True)
+        [second_key] = bencode.decode(b'd4:infodee', keytostr=True)
+        self.assertIs(first_key, second_key)
+
     @tcm.values(
         (b'd4:\x80i0ee',                1, ValueError, 'not a UTF-8 key'),     # invalid first byte
         (b'd4:\xF0\x82\x82\xACi0ee',    1, ValueError, 'not a UTF-8 key'),     # overlong encoding
@@ -1,10 +1,28 @@
+from collections import OrderedDict
 from datetime import datetime, timezone
+from enum import IntEnum
 
 import tcm
 
 from clot import bencode
 
 
+class Bytes(bytes):
+    pass
+
+
+class Color(IntEnum):
+    RED = 1
+
+
+class Items(list):
+    pass
+
+
+class Text(str):
+    pass
+
+
 class EncodeTestCase(tcm.TestCase):
     @tcm.values(
         # Bytes
@@ -49,6 +67,13 @@ class EncodeTestCase(tcm.TestCase):
         ({},                                    b'de'),
         ({b'cow': 'moo', 'spam': b'eggs'},      b'd3:cow3:moo4:spam4:eggse'),
         ({b'cow': [b'moo'], 'answer': 42},      b'd6:answeri42e3:cowl3:mooee'),
+
+        # Subclasses (encoded as their base types)
+        (Bytes(b'spam'),                        b'4:spam'),
+        (Color.RED,                             b'i1e'),
+        (Items([b'spam', 1]),                   b'l4:spami1ee'),
+        (OrderedDict([('b', 1), ('a', 2)]),     b'd1:ai2e1:bi1ee'),
+        ({Bytes(b'b'): 1, Text('a'): 2},        b'd1:ai2e1:bi1ee'),
     )
     def test_good_values_are_encoded(self, value, expected_result):
         result = bencode.encode(value)
@@ -91,6 +116,7 @@ class EncodeTestCase(tcm.TestCase):
 
     @tcm.values(
         ({'x': 1, b'x': 2}, []),
+        ({b'x': 1, 'x': 2}, []),
     )
     def test_duplicate_keys_will_raise(self, value, expected_locaton):
         with self.assertRaises(ValueError) as outcome:
@@ -127,16 +153,19 @@ class EncodeStrictTestCase(tcm.TestCase):
 class IterEncodeTestCase(tcm.TestCase):
     @tcm.values(
         # Bytes
-        (b'',       (b'0', b':')),
-        (b'spam',   (b'4', b':', b'spam')),
+        (b'',           (b'0:',)),
+        (b'spam',       (b'4:spam',)),
+        (b'x' * 256,    (b'256:' + b'x' * 256,)),
+        (b'x' * 65536,  (b'65536:', b'x' * 65536)),
 
         # Integers
-        (0,         (b'i', b'0', b'e')),
-        (-1,        (b'i', b'-1', b'e')),
+        (0,         (b'i0e',)),
+        (-1,        (b'i-1e',)),
+        (1024,      (b'i1024e',)),
 
         # Lists
         ([],                (b'l', b'e')),
-        ([b'spam', [-10]],  (b'l', b'4', b':', b'spam', b'l', b'i', b'-10', b'e', b'e', b'e')),
+        ([b'spam', [-10]],  (b'l', b'4:spam', b'l', b'i-10e', b'e', b'e')),
 
         # Dictionaries
         ({},
@@ -144,8 +173,8 @@ class IterEncodeTestCase(tcm.TestCase):
 
         ({b'cow': [b'moo'], b'answer': 42},
             (b'd',
-             b'6', b':', b'answer', b'i', b'42', b'e',
-             b'3', b':', b'cow', b'l', b'3', b':', b'moo', b'e',
+             b'6:answer', b'i42e',
+             b'3:cow', b'l', b'3:moo', b'e',
              b'e')),
 
         # Dictionary keys from the same character yet different composition
@@ -154,9 +183,9 @@ class IterEncodeTestCase(tcm.TestCase):
           '\N{ANGSTROM SIGN}': 3},
             (
             b'd',
-            b'3', b':', b'A\xcc\x8a',     b'i', b'1', b'e',
-            b'2', b':', b'\xc3\x85',      b'i', b'2', b'e',
-            b'3', b':', b'\xe2\x84\xab',  b'i', b'3', b'e',
+            b'3:A\xcc\x8a',     b'i1e',
+            b'2:\xc3\x85',      b'i2e',
+            b'3:\xe2\x84\xab',  b'i3e',
             b'e')),
     )
     def test_good_values_yield_parts(self, value, expected_result):
@@ -0,0 +1,114 @@
+from argparse import ArgumentTypeError, Namespace
+from contextlib import redirect_stdout
+import io
+from os import path, scandir
+from tempfile import TemporaryDirectory
+import threading
+import time
+
+import tcm
+
+from clot import app
+
+
+DATA_DIR = path.join(path.dirname(__file__), 'torrent', 'data')
+
+
+def make_args(**kwargs):
+    args = {
+        'verbose': False,
+        'recurse': False,
+        'follow_links': False,
+        'jobs': 1,
+        'ext': '.torrent',
+        'stash': None,
+        'fallback_encoding': None,
+        'lazy': False,
+        'func': lambda file_path, obj, args: None,
+    }
+    args.update(kwargs)
+    return Namespace(**args)
+
+
+class JobCountTestCase(tcm.TestCase):
+    @tcm.values(
+        ('0',   0),
+        ('1',   1),
+        ('16',  16),
+    )
+    def test_non_negative_integers_are_accepted(self, value, expected_result):
+        self.assertEqual(app._job_count(value), expected_result)    # pylint: disable=protected-access
+
+    @tcm.values(
+        ('-1',  "expected a non-negative integer instead of '-1'"),
+        ('x',   "expected a non-negative integer instead of 'x'"),
+        ('',    "expected a non-negative integer instead of ''"),
+    )
+    def test_other_values_will_raise(self, value, expected_message):
+        with self.assertRaises(ArgumentTypeError) as outcome:
+            app._job_count(value)   # pylint: disable=protected-access
+        message = outcome.exception.args[0]
+        self.assertEqual(message, expected_message)
+
+
+class HandleFileTestCase(tcm.TestCase):
+    @tcm.values(
+        (False, 1),
+        (False, 4),
+        (True,  1),
+        (True,  4),
+    )
+    def test_error_is_printed_right_after_the_path(self, verbose, jobs):
+        file_path = path.join(DATA_DIR, 'empty_file.torrent')
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            app.handle_file(file_path, make_args(verbose=verbose, jobs=jobs))
+
+        self.assertEqual(output.getvalue(), f"{file_path}\n\tValueError('value is empty', 0)\n")
+
+    @tcm.values(
+        (False, ''),
+        (True,  '{}\n'),
+    )
+    def test_path_is_printed_only_when_verbose(self, verbose, expected_output):
+        file_path = path.join(DATA_DIR, 'empty_dict.torrent')
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            app.handle_file(file_path, make_args(verbose=verbose, jobs=4))
+
+        self.assertEqual(output.getvalue(), expected_output.format(file_path))
+
+
+class TraverseDirTestCase(tcm.TestCase):
+    def test_unexpected_error_stops_concurrent_jobs(self):
+        file_count = 50
+        lock = threading.Lock()
+        calls = []
+        failures = []
+
+        with TemporaryDirectory() as dir_path:
+            for index in range(file_count):
+                with open(path.join(dir_path, f'{index}.torrent'), 'wb') as file:
+                    file.write(b'de')
+
+            # Keep the first file in order busy, so that the error comes from another one.
+            with scandir(dir_path) as entries:
+                first_path = next(entries).path
+
+            def func(file_path, obj, args):     # pylint: disable=unused-argument
+                with lock:
+                    calls.append(file_path)
+                    fail = file_path != first_path and not failures
+                    if fail:
+                        failures.append(file_path)
+
+                if fail:
+                    raise RuntimeError('unexpected')
+                time.sleep(0.2 if file_path == first_path else 0)
+
+            with self.assertRaises(RuntimeError):
+                app.traverse_dir(dir_path, make_args(jobs=2, func=func))
+
+        self.assertLess(len(calls), file_count)
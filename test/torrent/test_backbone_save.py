@@ -1,7 +1,8 @@
 from contextlib import contextmanager
 from datetime import datetime, timezone
 from os import path, remove
-from tempfile import NamedTemporaryFile
+from pathlib import Path
+from tempfile import mkstemp
 import textwrap
 
 import tcm
@@ -50,6 +51,16 @@ class SaveAsTestCase(tcm.TestCase):
             self.assertEqual(t.file_path, file_path)
             self.assertEqual(read_bytes(file_path), b'd2:my5:valuee')
 
+    def test_unexpected_types_will_raise_before_file_is_written(self):
+        t = torrent.new()
+        t.data['x'] = self
+
+        with temp_file_path(contents=SOME_BYTES) as file_path:
+            with self.assertRaises(TypeError):
+                t.save_as(file_path, overwrite=True)
+            self.assertIsNone(t.file_path)
+            self.assertEqual(read_bytes(file_path), SOME_BYTES)
+
 
 class SaveTestCase(tcm.TestCase):
     def test_orphan_torrent_will_raise(self):
@@ -269,23 +280,26 @@ class DumpTestCase(tcm.TestCase):
             self.assertTrue(path.exists(file_path))
             self.assertEqual(read_str(file_path), expected_json)
 
-    def test_unexpected_types_will_raise(self):
+    def test_unexpected_types_will_raise_before_file_is_written(self):
         t = torrent.new()
         t.data['x'] = self
 
-        with temp_file_path(suffix='.json') as file_path:
+        with temp_file_path(suffix='.json', contents=SOME_BYTES) as file_path:
             with self.assertRaises(TypeError) as outcome:
-                t.dump(file_path)
+                t.dump(file_path, overwrite=True)
             message = outcome.exception.args[0]
             self.assertIn('not JSON serializable', message)
+            self.assertEqual(read_bytes(file_path), SOME_BYTES)
 
 
 @contextmanager
 def temp_file_path(*, suffix='.torrent', contents=None):
-    with NamedTemporaryFile(prefix='clot-', suffix=suffix, delete=contents is None) as file:
+    fd, file_path = mkstemp(prefix='clot-', suffix=suffix)
+    with open(fd, 'wb') as file:
         if contents is not None:
             file.write(contents)
-        file_path = file.name
+    if contents is None:
+        remove(file_path)
 
     try:
         yield file_path
@@ -294,10 +308,8 @@ def temp_file_path(*, suffix='.torrent', contents=None):
 
 
 def read_bytes(file_path):
-    with open(file_path, 'rb') as file:
-        return file.read()
+    return Path(file_path).read_bytes()
 
 
 def read_str(file_path):
-    with open(file_path, 'r', encoding='utf-8') as file:
-        return file.read()
+    return Path(file_path).read_text(encoding='utf-8')
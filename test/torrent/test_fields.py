@@ -27,6 +27,21 @@ class LayoutTestCase(tcm.TestCase):
         message = outcome.exception.args[0]
         self.assertEqual(message, "'_Dummy' already has the '_fields' attribute")
 
+    @tcm.values(
+        ('data',),
+        'data',
+    )
+    def test_field_values_are_kept_in_slots(self, slots):
+        class Dummy(metaclass=Layout):
+            __slots__ = slots
+            field_x = Field('x', int)
+
+        dummy = Dummy()
+        dummy.field_x = 1
+
+        self.assertFalse(hasattr(dummy, '__dict__'))
+        self.assertEqual(getattr(dummy, '_field_x'), 1)
+
     def test_fields_can_be_loaded_at_once(self):
         class Dummy(Base):
             field_x = Field('x', int)
@@ -54,6 +69,21 @@ class LayoutTestCase(tcm.TestCase):
         dummy.save_fields()     # pylint: disable=no-member
         self.assertDictEqual(dummy.data, {'x': 1, 'y': 2})
 
+    def test_dependencies_are_loaded_first_and_saved_in_order(self):
+        class Dummy(Base):
+            field = String('x')
+            codepage = Integer('codepage')
+
+        dummy = Dummy(x=LETTER_BE.encode('cp1251'), codepage=1251)
+        dummy.load_fields()     # pylint: disable=no-member
+
+        self.assertEqual(getattr(dummy, '_field'), LETTER_BE)
+        self.assertEqual(getattr(dummy, '_codepage'), 1251)
+
+        self.assertDictEqual(dummy.data, {})
+        dummy.save_fields()     # pylint: disable=no-member
+        self.assertListEqual(list(dummy.data), ['x', 'codepage'])
+
 
 class FieldTestCase(tcm.TestCase):
     def test_property_itself_is_accessible(self):
@@ -198,6 +228,8 @@ class HighLevelTypesTestCase(tcm.TestCase):
     @tcm.values(
         (Bytes,     b'123',                 b'\r \n \t \v \f'),
         (String,    '123',                  '\r \n \t \v \f'),
+        (Bytes,     b'123',                 b''),
+        (String,    '123',                  ''),
     )
     def test_nonempty_value_is_enforced(self, field_type, good_value, empty_value):
         class Dummy(Base):
@@ -296,6 +328,34 @@ class StringTestCase(tcm.TestCase):
         message = outcome.exception.args[0]
         self.assertEqual(message, r"explicit_field: cannot decode b'\xd0\x91' as ASCII")
 
+    @tcm.values(
+        ('cp1251',             b'abc',                 'abc'),
+        ('UTF-16-LE',          b'ab',                  '\N{CJK UNIFIED IDEOGRAPH-6261}'),
+        ('ISO-2022-JP',        b'\x1b$BF|K\\8l\x1b(B', '\u65e5\u672c\u8a9e'),
+        ('UTF-7',              b'+ZeVnLIqe-',          '\u65e5\u672c\u8a9e'),
+        ('cp037',              b'abc',                 '/\xc2\xc4'),
+        ('raw_unicode_escape', b'\\u0041',             'A'),
+        ('unicode_escape',     b'a\\tb',               'a\tb'),
+        ('idna',               b'xn--nxasmq6b',        '\u03b2\u03cc\u03bb\u03bf\u03c3'),
+        ('punycode',           b'nxasmq6b',            '\u03b2\u03cc\u03bb\u03bf\u03c3'),
+    )
+    def test_ascii_value_is_decoded_according_to_encoding(self, encoding, value, expected_result):
+        class Dummy(Base):
+            field = String('x', encoding=encoding)
+
+        dummy = Dummy(x=value)
+        self.assertEqual(dummy.field, expected_result)
+
+    def test_ascii_value_can_fail_to_decode(self):
+        class Dummy(Base):
+            field = String('x', encoding='UTF-32-LE')
+
+        dummy = Dummy(x=b'abcd')
+        with self.assertRaises(ValueError) as outcome:
+            _ = dummy.field
+        message = outcome.exception.args[0]
+        self.assertEqual(message, "field: cannot decode b'abcd' as UTF-32-LE")
+
     def test_torrent_codepage_is_used(self):
         class Dummy(Base):
             codepage = 1251
@@ -368,6 +428,7 @@ class UrlTestCase(tcm.TestCase):
         (b'hostname',           [],       ValueError,   "field: the value 'hostname' is ill-formed (missing scheme)"),
         (b'hostname',           [''],     ValueError,   "field: the value 'hostname' is ill-formed (missing scheme)"),
         (b'http://:20',         None,     ValueError,   "field: the value 'http://:20' is ill-formed (missing hostname)"),
+        (b'http:// :20',        None,     ValueError,   "field: the value 'http:// :20' is ill-formed (missing hostname)"),
     )
     def test_malformed_string_will_raise_on_load(self, value, schemes, exception_type, expected_message):
         class Dummy(Base):
@@ -381,6 +442,7 @@ class UrlTestCase(tcm.TestCase):
 
     @tcm.values(
         (b'ftp://hostname',         ['ftp']),
+        (b'FTP://hostname',         ['Ftp']),
         (b'https://hostname',       None),
         (b'http://hostname:123',    None),
         (b'udp://hostname',         None),
@@ -433,6 +495,7 @@ class UrlListTestCase(tcm.TestCase):
 
     @tcm.values(
         (b'ftp://hostname',         ['ftp']),
+        (b'FTP://hostname',         ['Ftp']),
         (b'https://hostname',       None),
     )
     def test_valid_bytes_is_accepted(self, value, schemes):
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import tcm
 
 from clot import bencode, torrent
@@ -6,6 +9,22 @@ from clot import bencode, torrent
 LETTER_BE = '\N{CYRILLIC CAPITAL LETTER BE}'
 
 
+class ExtraMetainfo(torrent.Metainfo):
+    pass
+
+
+class PrivateMetainfo(torrent.Metainfo):
+    __slots__ = ('__secret',)
+
+    def __init__(self, raw_bytes, secret, **kwargs):
+        super().__init__(raw_bytes, **kwargs)
+        self.__secret = secret
+
+    @property
+    def secret(self):
+        return self.__secret
+
+
 class CreateTestCase(tcm.TestCase):
     def test_new_torrent_has_none_in_all_fields(self):
         t = torrent.new()
@@ -91,3 +110,67 @@ class CreateTestCase(tcm.TestCase):
         t.fallback_encoding = 'cp1251'
         t.load_fields()         # pylint: disable=no-member
         self.assertEqual(t.comment, LETTER_BE)
+
+
+class CopyTestCase(tcm.TestCase):
+    raw_bytes = bencode.encode({
+        'announce-list': [['http://tracker'], ['http://backup1']],
+        'comment': 'a trivial comment',
+        'nodes': [['host-a', 123], ['host-b', 456]],
+        'url-list': ['http://mirror.com/pub'],
+        'unknown to clot': 'stays in data dict',
+    })
+
+    def assert_same_torrent(self, copied, original):
+        self.assertIsNot(copied, original)
+        self.assertDictEqual(copied.data, original.data)
+        self.assertEqual(copied.comment, original.comment)
+        self.assertEqual(copied.announce_list, original.announce_list)
+        self.assertEqual(copied.nodes, original.nodes)
+        self.assertEqual(copied.url_list, original.url_list)
+
+        copied.nodes.append(['host-c', 789])
+        self.assertListEqual(list(copied.nodes), ['host-a:123', 'host-b:456', 'host-c:789'])
+
+    def test_torrent_can_be_pickled(self):
+        t = torrent.parse(self.raw_bytes)
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assert_same_torrent(pickle.loads(pickle.dumps(t, protocol)), t)
+
+    def test_torrent_is_unpickled_without_loading_fields(self):
+        t = ExtraMetainfo(self.raw_bytes, file_path='x.torrent', fallback_encoding='cp1251', lazy=True)
+        t.extra = 42    # pylint: disable=attribute-defined-outside-init
+        self.assertEqual(t.comment, 'a trivial comment')
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            other = pickle.loads(pickle.dumps(t, protocol))
+            self.assertIsInstance(other, ExtraMetainfo)
+            self.assertEqual(other.file_path, 'x.torrent')
+            self.assertEqual(other.fallback_encoding, 'cp1251')
+            self.assertEqual(other.extra, 42)
+            self.assertTrue(hasattr(other, '_comment'))
+            self.assertFalse(hasattr(other, '_nodes'))
+            self.assertDictEqual(other.data, t.data)
+            self.assertIsNot(other.data, t.data)
+
+        self.assert_same_torrent(other, t)
+
+    def test_torrent_subclass_attributes_are_kept(self):
+        t = ExtraMetainfo(self.raw_bytes)
+        t.extra = 42    # pylint: disable=attribute-defined-outside-init
+        private = PrivateMetainfo(self.raw_bytes, 'secret')
+
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(t, protocol)).extra, 42)
+            self.assertEqual(pickle.loads(pickle.dumps(private, protocol)).secret, 'secret')
+
+        for copy_function in (copy.copy, copy.deepcopy):
+            self.assertEqual(copy_function(t).extra, 42)
+            self.assertEqual(copy_function(private).secret, 'secret')
+
+    def test_torrent_can_be_deep_copied(self):
+        t = torrent.parse(self.raw_bytes)
+
+        self.assert_same_torrent(copy.deepcopy(t), t)
+        self.assertListEqual(list(t.nodes), ['host-a:123', 'host-b:456'])
@@ -1,8 +1,17 @@
+import copy
+import pickle
+
 import tcm
 
 from clot.torrent.values import List
 
 
+def as_text(value):
+    if isinstance(value, int):
+        return str(value)
+    raise TypeError(f'expected {value!r} to be of type {int}')
+
+
 class TestCase(tcm.TestCase):
     @staticmethod
     def valid_item(value):
@@ -53,6 +62,16 @@ class TestCase(tcm.TestCase):
         self.assertListEqual(list(x), [20, 10, 30, 40, 60, 50])
         self.assertEqual(repr(x), 'List([20, 10, 30, 40, 60, 50])')
 
+        x += (70,)
+        x.extend(x)
+        self.assertIsInstance(x, List)
+        self.assertListEqual(list(x), [20, 10, 30, 40, 60, 50, 70] * 2)
+
+    def test_list_supports_membership_tests(self):
+        x = List(self.valid_item, 20, 10)
+        self.assertIn(10, x)
+        self.assertNotIn(30, x)
+
     def test_list_can_be_indexed(self):
         x = List(self.valid_item, 20, 10)
         self.assertListEqual(list(x), [20, 10])
@@ -106,3 +125,43 @@ class TestCase(tcm.TestCase):
             x[0] = -3
         message = outcome.exception.args[0]
         self.assertEqual(message, 'invalid item -3')
+
+        with self.assertRaises(ValueError) as outcome:
+            x += [4, -3]
+        message = outcome.exception.args[0]
+        self.assertEqual(message, 'invalid item -3')
+
+        with self.assertRaises(ValueError) as outcome:
+            x.insert(0, -3)
+        message = outcome.exception.args[0]
+        self.assertEqual(message, 'invalid item -3')
+
+        self.assertListEqual(list(x), [1, 2, 3])
+
+    def test_list_can_be_pickled_without_revalidating_items(self):
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            x = pickle.loads(pickle.dumps(List(as_text, 1, 2), protocol))
+            self.assertIsInstance(x, List)
+            self.assertListEqual(list(x), ['1', '2'])
+
+            x.append(3)
+            self.assertListEqual(list(x), ['1', '2', '3'])
+
+            with self.assertRaises(TypeError):
+                x.append('4')
+
+    def test_list_can_be_copied_without_revalidating_items(self):
+        x = List(as_text, 1, 2)
+
+        for y in (copy.copy(x), copy.deepcopy(x)):
+            self.assertIsInstance(y, List)
+            self.assertIsNot(y, x)
+            self.assertListEqual(list(y), ['1', '2'])
+
+            y.append(3)
+            self.assertListEqual(list(y), ['1', '2', '3'])
+            self.assertListEqual(list(x), ['1', '2'])
+
+    def test_list_compares_equal_to_plain_list(self):
+        self.assertEqual(List(as_text, 1, 2), ['1', '2'])
+        self.assertNotEqual(List(as_text, 1, 2), ['2', '1'])